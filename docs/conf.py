@@ -5,9 +5,6 @@ import pkg_resources
 import subprocess
 import sys
 
-import sphinx_rtd_theme
-from sphinx.ext.apidoc import main
-
 web_docs = False
 if 'PSIJ_WEB_DOCS' in os.environ:
 	web_docs = True
@@ -22,6 +19,7 @@ copyright = u'The ExaWorks Team'
 if web_docs:
 	html_theme = 'cloud'
 else:
+	import sphinx_rtd_theme
 	html_theme = 'sphinx_rtd_theme'
 	html_theme_path = [sphinx_rtd_theme.get_html_theme_path()]
 html_favicon = 'favicon.ico'
@@ -30,8 +28,6 @@ add_module_names = False
 python_use_unqualified_type_names = True
 autodoc_mock_imports = ['flux']
 nitpick_ignore = [
-    ('py:class', 'distutils.version.StrictVersion'),
-    ('py:class', 'distutils.version.Version'),
     ('py:class', 'packaging.version.Version')
 ]
 
@@ -82,16 +78,23 @@ autodoc_default_options = {
 release = None
 version = None
 src_dir = None
+_version_cache = {}
 
 def read_version(docs_dir):
     global release, version, src_dir
+    if docs_dir in _version_cache:
+        release, src_dir = _version_cache[docs_dir]
+        version = release
+        return
     src_dir = os.path.abspath(os.path.join(docs_dir, '../src'))
 
-    sys.path.insert(0, src_dir)
+    if src_dir not in sys.path:
+        sys.path.insert(0, src_dir)
 
     import psij
     release = psij.__version__
     version = release
+    _version_cache[docs_dir] = (release, src_dir)
 
 
 my_dir = os.path.normpath(os.path.dirname(__file__))
@@ -117,6 +120,7 @@ def run_apidoc(sphinx):
         subprocess.run([sys.executable, generate_path], cwd=sphinx.srcdir, check=True, 
                        env={'PYTHONPATH': src_dir})
     else:
+        from sphinx.ext.apidoc import main
         main(['-f', '-t', os.path.join(my_dir, '_sphinx'), '-o', output_path, src_dir])
 
 
@@ -146,17 +150,13 @@ class MyPythonDomain(PythonDomain):
     def find_obj(self, env, modname, classname, name, type, searchmode=0):
         """Ensures an object always resolves to the desired module if defined there."""
         orig_matches = PythonDomain.find_obj(self, env, modname, classname, name, type, searchmode)
-        matches = []
+        if name[:1] == '.' or name[-1:] == '.':
+            name = name.strip('.')
+        desired_name = 'psij.' + name
         for match in orig_matches:
-            match_name = match[0]
-            desired_name = 'psij.' + name.strip('.')
-            if match_name == desired_name:
-                matches.append(match)
-                break
-        if matches:
-            return matches
-        else:
-            return orig_matches
+            if match[0] == desired_name:
+                return [match]
+        return orig_matches
 
 # launch setup
 def setup(app):
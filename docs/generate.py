@@ -6,10 +6,12 @@
 #   - index.rst (index of classes, global functions)
 import importlib
 import inspect
+import os
+import pkgutil
 import sys
-from io import TextIOBase
+from functools import lru_cache
 from types import ModuleType
-from typing import List, Type, Set, Tuple
+from typing import Callable, Dict, List, Type, Set, Tuple
 
 import psij
 
@@ -18,16 +20,19 @@ HEADING_CHARS = ['-', '^', '~', '"', '*']
 seen_names = set()
 
 
+@lru_cache(maxsize=None)
 def is_module(name: str) -> bool:
     return name in sys.modules
 
 
+@lru_cache(maxsize=None)
 def split_class_name(name: str) -> Tuple[str, str]:
     dot_ix = name.rindex('.')
 
     return name[0:dot_ix], name[dot_ix + 1:]
 
 
+@lru_cache(maxsize=None)
 def get_object(name: str) -> object:
     if '.' not in name:
         return None
@@ -42,101 +47,118 @@ def get_object(name: str) -> object:
         return None
 
 
+@lru_cache(maxsize=None)
 def is_class(name: str) -> bool:
     return inspect.isclass(get_object(name))
 
 
+@lru_cache(maxsize=None)
 def is_function(name: str) -> bool:
     return inspect.isfunction(get_object(name))
 
 
+@lru_cache(maxsize=None)
 def get_module_classes(name: str) -> List[str]:
     try:
-        classes = set()
         mod = importlib.import_module(name)
-        _dir(sys.modules[name], set(), classes, classes)
-        #return [cls.__name__ for cls in classes if cls.__module__ == name and ]
-        return [cls.__name__ for cls in classes if cls.__module__ == name]
+        # functions are included so that they are also marked as seen
+        return [member for member, _ in _public_members(mod, _is_class_or_function)]
     except Exception as ex:
         print(ex)
         return []
 
 
-def write_heading(out: TextIOBase, name: str, level: int) -> None:
-    out.write(name)
-    out.write('\n')
-    out.write(HEADING_CHARS[level] * len(name))
-    out.write('\n\n')
+def write_heading(out: List[str], name: str, level: int) -> None:
+    out.append(name)
+    out.append('\n')
+    out.append(HEADING_CHARS[level] * len(name))
+    out.append('\n\n')
+
+
+def _append_literal(out: List[str], name: str) -> None:
+    out.append(name[1:-1])
+    out.append('\n')
+
+
+def _append_raw(out: List[str], name: str) -> None:
+    out.append(name)
+    out.append('\n')
 
 
 def generate_tree() -> None:
-    with open('api.tree', 'r') as f:
-        with open('.generated/tree.rst', 'w') as out:
-            for line in f:
-                line = line.rstrip()
-                name = line.lstrip()
-                # 4 spaces per indent level
-                indent_level = (len(line) - len(name)) // 4
-                if name.startswith('#'):
-                    continue
-                if name.startswith('~'):
-                    nofqn = True
-                    name = name[1:]
-                else:
-                    nofqn = False
-
-                if name == '':
-                    out.write('\n')
-                elif name.startswith('"'):
-                    out.write(name[1:-1])
-                    out.write('\n')
-                elif name.startswith('..'):
-                    out.write(name)
-                    out.write('\n')
-                elif name == '+executors':
-                    generate_executors(out)
-                elif name == '+launchers':
-                    generate_launchers(out)
-                elif name.endswith('.rst'):
-                    out.write('.. toctree::\n    %s\n\n' % name[:-4])
-                elif is_module(name):
-                    print('Module: %s' % name)
-                    write_heading(out, name + ' module', indent_level)
-                    out.write('.. automodule:: %s\n    :members:\n\n' % name)
-                    print('%s -> %s' % (name, get_module_classes(name)))
-                    seen_names.update(get_module_classes(name))
-                elif is_function(name):
-                    print('Function: %s' % name)
-                    mod_name, fn_name = split_class_name(name)
-                    write_heading(out, fn_name if nofqn else name, indent_level)
-                    out.write('.. automodule:: %s\n    :members: %s\n' % (mod_name, fn_name))
-                    if name in seen_names or cls.__name__ in seen_names:
-                        out.write('    :noindex:\n')
-                    out.write('\n')
-                    seen_names.add(name)
-                elif is_class(name):
-                    print('Class: %s' % name)
-                    cls = get_object(name)
-                    write_heading(out, cls.__name__, indent_level)
-                    out.write('.. autoclass:: %s\n    :members:\n' % name)
-                    if name in seen_names or cls.__name__ in seen_names:
-                        out.write('    :noindex:\n')
-                    out.write('\n')
-                    seen_names.add(name)
-                else:
-                    print('Heading: %s' % name)
-                    write_heading(out, name, indent_level)
-
-
-def generate_executors(out: TextIOBase) -> None:
+    out: List[str] = []
+    with open('api.tree', 'r', buffering=65536, encoding='utf-8') as f:
+        for line in f:
+            name = line.strip()
+            # 4 spaces per indent level
+            indent_level = (len(line) - len(line.lstrip())) // 4
+            if name.startswith('#'):
+                continue
+            if name.startswith('~'):
+                nofqn = True
+                name = name[1:]
+            else:
+                nofqn = False
+
+            if name == '':
+                out.append('\n')
+                continue
+            handler = _TREE_HANDLERS.get(name[:2]) or _TREE_HANDLERS.get(name[0])
+            if handler is not None:
+                handler(out, name)
+                continue
+            generator = _GENERATORS.get(name)
+            if generator is not None:
+                generator(out)
+                continue
+
+            if name.endswith('.rst'):
+                out.append('.. toctree::\n    %s\n\n' % name[:-4])
+            elif is_module(name):
+                print('Module: %s' % name)
+                write_heading(out, name + ' module', indent_level)
+                out.append('.. automodule:: %s\n    :members:\n\n' % name)
+                classes = get_module_classes(name)
+                print('%s -> %s' % (name, classes))
+                seen_names.update(classes)
+            elif is_function(name):
+                print('Function: %s' % name)
+                mod_name, fn_name = split_class_name(name)
+                write_heading(out, fn_name if nofqn else name, indent_level)
+                out.append('.. automodule:: %s\n    :members: %s\n' % (mod_name, fn_name))
+                if name in seen_names or fn_name in seen_names:
+                    out.append('    :noindex:\n')
+                out.append('\n')
+                seen_names.add(name)
+            elif is_class(name):
+                print('Class: %s' % name)
+                short_name = get_object(name).__name__
+                write_heading(out, short_name, indent_level)
+                out.append('.. autoclass:: %s\n    :members:\n' % name)
+                if name in seen_names or short_name in seen_names:
+                    out.append('    :noindex:\n')
+                out.append('\n')
+                seen_names.add(name)
+            else:
+                print('Heading: %s' % name)
+                write_heading(out, name, indent_level)
+
+    with open('.generated/tree.rst', 'w', encoding='utf-8') as f:
+        f.write(''.join(out))
+
+
+def generate_executors(out: List[str]) -> None:
     from psij import JobExecutor
 
     for name in sorted(JobExecutor.get_executor_names()):
         versions = JobExecutor._executors[name.lower()]
         assert len(versions) == 1
+        if versions[0].desc.name != name:
+            # an alias; documented under the main name
+            continue
         qname = versions[0].desc.cls
         write_heading(out, versions[0].desc.nice_name, 1)
-        out.write('.. autoclass:: %s\n\n' % qname)
+        out.append('.. autoclass:: %s\n\n' % qname)
         seen_names.add(qname)
 
         module_name, class_name = split_class_name(qname)
@@ -145,36 +167,57 @@ def generate_executors(out: TextIOBase) -> None:
             if cls != class_name:
                 write_heading(out, cls, 2)
                 qname = module_name + '.' + cls
-                out.write('.. autoclass:: %s\n\n' % qname)
+                out.append('.. autoclass:: %s\n\n' % qname)
                 seen_names.add(cls)
 
 
-def generate_launchers(out: TextIOBase) -> None:
+def generate_launchers(out: List[str]) -> None:
     from psij import Launcher
 
     for name in sorted(Launcher.get_launcher_names()):
         versions = Launcher._launchers[name.lower()]
         assert len(versions) == 1
+        if versions[0].desc.name != name:
+            # an alias; documented under the main name
+            continue
         qname = versions[0].desc.cls
         write_heading(out, versions[0].desc.nice_name, 1)
-        out.write('.. autoclass:: %s\n\n' % qname)
+        out.append('.. autoclass:: %s\n\n' % qname)
         seen_names.add(qname)
 
 
-def _dir(obj: object, modules: Set[object], classes: Set[object], functions: Set[object]):
-    if inspect.ismodule(obj):
-        if obj.__name__.startswith('psij') and obj not in modules:
-            modules.add(obj)
-            for child in dir(obj):
-                _dir(getattr(obj, child), modules, classes, functions)
-    elif inspect.isclass(obj):
-        if obj not in classes:
-            if not obj.__name__.startswith('_') and obj.__module__.startswith('psij.'):
-                classes.add(obj)
-    elif inspect.isfunction(obj):
-        if obj not in functions:
-            if not obj.__name__.startswith('_') and obj.__module__.startswith('psij.'):
-                functions.add(obj)
+_GENERATORS: Dict[str, Callable[[List[str]], None]] = {
+    '+executors': generate_executors,
+    '+launchers': generate_launchers,
+}
+
+# dispatch on the prefix of a line for literals and directives
+_TREE_HANDLERS: Dict[str, Callable[[List[str], str], None]] = {
+    '"': _append_literal,
+    '..': _append_raw,
+}
+
+
+def _is_class_or_function(obj: object) -> bool:
+    return inspect.isclass(obj) or inspect.isfunction(obj)
+
+
+def _public_members(mod: ModuleType, predicate: Callable[[object], bool]) \
+        -> List[Tuple[str, object]]:
+    # only return objects defined in mod itself, so that re-exports are listed once
+    return [(name, obj) for name, obj in inspect.getmembers(mod, predicate)
+            if not name.startswith('_') and obj.__module__ == mod.__name__]
+
+
+def _walk_modules() -> List[ModuleType]:
+    # Only consider modules that have been loaded by psij itself (directly or through
+    # plugins). This excludes private and legacy modules that are not part of the API.
+    modules = [psij]
+    for info in pkgutil.walk_packages(psij.__path__, psij.__name__ + '.',
+                                      onerror=lambda name: None):
+        if info.name in sys.modules and not info.name.rsplit('.', 1)[-1].startswith('_'):
+            modules.append(sys.modules[info.name])
+    return modules
 
 
 def _sorted_names(set: Set[object]) -> List[Tuple[str, object]]:
@@ -189,29 +232,48 @@ def _sorted_names(set: Set[object]) -> List[Tuple[str, object]]:
 
 
 def generate_index() -> None:
-    modules = set()
     classes = set()
     functions = set()
 
-    _dir(psij, modules, classes, functions)
-    with open('.generated/index.rst', 'w') as out:
-        write_heading(out, 'Index', 0)
-        write_heading(out, 'Classes', 1)
-        for name, val in _sorted_names(classes):
-            write_heading(out, name, 2)
-            qname = val.__module__ + '.' + name
-            out.write('.. autoclass:: %s\n' % qname)
-            if qname in seen_names or name in seen_names:
-                out.write('    :noindex:\n')
-            out.write('\n\n')
-
-        write_heading(out, 'Functions', 1)
-        for name, val in _sorted_names(functions):
-            write_heading(out, name, 2)
-            qname = val.__module__ + '.' + name
-            out.write('.. autofunction:: %s\n    :noindex:\n\n' % qname)
+    for mod in _walk_modules():
+        classes.update(obj for _, obj in _public_members(mod, inspect.isclass))
+        functions.update(obj for _, obj in _public_members(mod, inspect.isfunction))
+
+    out: List[str] = []
+    write_heading(out, 'Index', 0)
+    write_heading(out, 'Classes', 1)
+    for name, val in _sorted_names(classes):
+        write_heading(out, name, 2)
+        qname = val.__module__ + '.' + name
+        out.append('.. autoclass:: %s\n' % qname)
+        if qname in seen_names or name in seen_names:
+            out.append('    :noindex:\n')
+        out.append('\n\n')
+
+    write_heading(out, 'Functions', 1)
+    for name, val in _sorted_names(functions):
+        write_heading(out, name, 2)
+        qname = val.__module__ + '.' + name
+        out.append('.. autofunction:: %s\n    :noindex:\n\n' % qname)
+
+    with open('.generated/index.rst', 'w', encoding='utf-8') as f:
+        f.write(''.join(out))
+
+
+def load_plugins() -> None:
+    # plugin classes are loaded lazily; load them all so that their modules can be documented
+    from psij import JobExecutor, Launcher
+    from psij._plugins import _ensure_loaded
+
+    psij._discover_plugins()
+    for store in (JobExecutor._executors, Launcher._launchers):
+        for versions in store.values():
+            for entry in versions:
+                _ensure_loaded(entry)
 
 
 if __name__ == '__main__':
+    os.makedirs('.generated', exist_ok=True)
+    load_plugins()
     generate_tree()
     generate_index()
@@ -1,7 +1,5 @@
 import psij
 
-jex = psij.JobExecutor.get_instance('slurm')
-
 N=2 # number of jobs to run
 
 def make_job(i):
@@ -13,11 +11,14 @@ def make_job(i):
     job.spec = spec
     return job
 
-jobs = []
-for i in range(N):
-    job = make_job(i)
-    jobs.append(job)
-    jex.submit(job)
+if __name__ == '__main__':
+    jex = psij.JobExecutor.get_instance('slurm')
+
+    jobs = []
+    for i in range(N):
+        job = make_job(i)
+        jobs.append(job)
+        jex.submit(job)
 
-for i in range(N):
-    jobs[i].wait()
\ No newline at end of file
+    for job in jobs:
+        job.wait()
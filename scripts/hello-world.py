@@ -1,7 +1,5 @@
 import psij
 
-jex = psij.JobExecutor.get_instance('slurm')
-
 N=1 # number of jobs to run
 
 def make_job():
@@ -26,12 +24,15 @@ def make_job():
     job.spec = spec
     return job
 
-jobs = []
-for i in range(N):
-    job = make_job()
-    jobs.append(job)
-    jex.submit(job)
+if __name__ == '__main__':
+    jex = psij.JobExecutor.get_instance('slurm')
+
+    jobs = []
+    for i in range(N):
+        job = make_job()
+        jobs.append(job)
+        jex.submit(job)
 
-for i in range(N):
-    jobs[i].wait()
+    for job in jobs:
+        job.wait()
 
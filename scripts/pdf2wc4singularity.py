@@ -51,17 +51,11 @@ def make_singularity_spec(image=None,
     spec.executable = 'singularity'
     spec.stdout_path = 'singularity.' + command + '.stdout'
     spec.stderr_path = 'singularity.' + command + '.stderr'
-    bind = []
-    for f in bind_input:
-        if f:
-            d = os.path.abspath(f)
-            bind += ["--bind", f"{f}:{d}"]
-    for f in bind_output:
-        if f:
-            # missing, if f does not exists create f
-            d = os.path.abspath(f)
-            bind += ["--bind", f"{f}:{d}"]
-    spec.arguments = ['run'] + bind + [image, command] + options
+    # missing, if an output path does not exist create it
+    cwd = os.getcwd()
+    bind = [arg for f in (*bind_input, *bind_output) if f
+            for arg in ("--bind", f"{f}:{os.path.normpath(os.path.join(cwd, f))}")]
+    spec.arguments = ['run', *bind, image, command, *options]
 
     return spec
 
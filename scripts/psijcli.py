@@ -6,103 +6,115 @@ from psij import JobSpec
 import sys
 import os
 import argparse
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from psij import Import
 
 
+EXECUTORS = ("cobalt", "local", "batch-test", "flux", "lsf", "rp", "slurm")
+
+_IMPORTER = Import()
+
+
+@lru_cache(maxsize=64)
+def _load_cached(path, mtime):
+    job_spec = _IMPORTER.load(path)
+    if job_spec and isinstance(job_spec, JobSpec):
+        return job_spec
+    return None
+
+
+def load_job_spec(path):
+    # keyed on the modification time so that a changed file is loaded again
+    path = os.path.abspath(path)
+    return _load_cached(path, os.path.getmtime(path))
+
+
+def main():
+    parser = argparse.ArgumentParser(prog='psijcli')
+    subparser = parser.add_subparsers(dest="command", help='Subcommands')
+    validate_parser = subparser.add_parser("validate", help='validate JobSpec file')
+    validate_parser.add_argument("file", help="JobSpec file")
+    execute_parser = subparser.add_parser("run", help='execute JobSpec file')
+    execute_parser.add_argument( "executor",
+                                choices = EXECUTORS,
+                                )
+    execute_parser.add_argument("file", help="JobSpec file")
+    execute_parser.add_argument("-n",
+                                "--number-of-jobs",
+                                dest = "jobs",
+                                type = int,
+                                default=1,
+                                help="Number of jobs to submit, default 1"
+                                )
+
+    parser.add_argument("-v", "--verbose",
+                        dest = "verbose",
+                        default=False,
+                        action='store_true',
+                        help="print detailed information")
+
+    parser.add_argument("--debug",
+                        dest = "debug",
+                        action='store_true',
+                        help="print debug information")
+
+    # parser.print_help()
+
+    args = parser.parse_args()
+
+    if args.command == 'validate':
+        if args.verbose:
+            print("Validating " + args.file)
+        job_spec = load_job_spec(args.file)
+
+        if job_spec:
+            print("File ok")
+        else:
+            sys.exit("Not a valid file, could not import " + args.file)
+    elif args.command == "run":
+
+        if not args.executor:
+            sys.exit("Missing argument executor")
+
+        if args.verbose:
+            print("Importing " + args.file)
+        job_spec = load_job_spec(args.file)
+        if not job_spec:
+            sys.exit("Something wrong with JobSpec")
+
+        # Get job executor
+        if args.verbose:
+            print("Initializing job executor")
+
+        jex = None
+
+        try:
+            jex = psij.JobExecutor.get_instance(args.executor)
+        except ValueError as err:
+            sys.exit(f"Panic, {err}")
+        except BaseException as err:
+            sys.exit(f"Unexpected: {err}, {type(err)}")
+
+        # Submit jobs
+        number_of_jobs = args.jobs
+        if args.verbose:
+            print("Submitting " + str(number_of_jobs) + " job(s)")
+
+        jobs = [psij.Job(job_spec) for _ in range(number_of_jobs)] # list of created jobs
+        # submit concurrently so that slow submissions (e.g., to a batch scheduler) overlap
+        with ThreadPoolExecutor(max_workers=max(1, min(32, number_of_jobs))) as pool:
+            list(pool.map(jex.submit, jobs))
+
+        if args.verbose:
+            print("Waiting for jobs to finish")
+        for job in jobs:
+            job.wait()
+    else:
+        # Should never be here
+        sys.stderr.write("Missig command. Use --help for more information.\n")
+        parser.print_help(sys.stderr)
 
 
-parser = argparse.ArgumentParser(prog='psijcli')
-subparser = parser.add_subparsers(dest="command", help='Subcommands')
-validate_parser = subparser.add_parser("validate", help='validate JobSpec file')
-validate_parser.add_argument("file", help="JobSpec file")
-execute_parser = subparser.add_parser("run", help='execute JobSpec file')
-execute_parser.add_argument( "executor",
-                            choices = [ "cobalt",
-                                        "local",
-                                        "batch-test",
-                                        "flux",
-                                        "lsf",
-                                        "rp",
-                                        "slurm"
-                                        ],
-                            )
-execute_parser.add_argument("file", help="JobSpec file")
-execute_parser.add_argument("-n",
-                            "--number-of-jobs",
-                            dest = "jobs",
-                            type = int,
-                            default=1,
-                            help="Number of jobs to submit, default 1"
-                            )
-
-parser.add_argument("-v", "--verbose",
-                    dest = "verbose",
-                    default=False,
-                    action='store_true',
-                    help="print detailed information")
-
-parser.add_argument("--debug",
-                    dest = "debug",
-                    action='store_true',
-                    help="print debug information")
-
-
-# parser.print_help()
-
-args = parser.parse_args()
-
-i = Import()
-
-if args.command == 'validate':
-    if args.verbose:
-        print("Validating " + args.file)
-    job_spec = i.load(args.file)
-
-    if job_spec and  isinstance(job_spec, JobSpec):
-        print("File ok")
-    else:
-        sys.exit("Not a valid file, could not import " + args.file)
-elif args.command == "run":
-
-    if not args.executor:
-        sys.exit("Missing argument executor")
-
-    if args.verbose:
-        print("Importing " + args.file)
-    job_spec = i.load(args.file)
-    if not (job_spec and  isinstance(job_spec, JobSpec)):
-        sys.exit("Something wrong with JobSpec")
-
-    # Get job executor
-    if args.verbose:
-        print("Initializing job executor")
-
-    jex = None
-
-    try:
-        jex = psij.JobExecutor.get_instance(args.executor)
-    except ValueError as err:
-        sys.exit(f"Panic, {err}")
-    except BaseException as err:
-        sys.exit(f"Unexpected: {err}, {type(err)}")
-
-    # Submit jobs
-    number_of_jobs = args.jobs
-    if args.verbose:
-        print("Submitting " + str(number_of_jobs) + " job(s)")
-
-    jobs = [] # list of created jobs
-    for i in range(number_of_jobs):
-        job = psij.Job()
-        job.spec = job_spec
-        jobs.append(job)
-        jex.submit(job)
-
-    if args.verbose:
-        print("Waiting for jobs to finish")
-    for i in range(number_of_jobs):
-        jobs[i].wait()
-else:
-    # Should never be here
-    sys.stderr.write("Missig command. Use --help for more information.\n")
-    parser.print_help(sys.stderr)
+if __name__ == '__main__':
+    main()
@@ -4,7 +4,8 @@ import logging
 import os
 import pkgutil
 import sys
-from typing import Callable, TypeVar
+import threading
+from typing import Callable, Optional, Set, TypeVar
 
 from psij.descriptor import Descriptor
 from .exceptions import SubmitException, InvalidJobException
@@ -36,11 +37,33 @@ class _PluginType:
     def __init__(self, name: str, registration_method: Callable[[Descriptor, str], None]):
         self.name = name
         self.registration_method = registration_method
+        self.var_name = '__PSI_J_' + name.upper() + '__'
 
 
 PACKAGE = ['psij-descriptors']
 
 
+def _get_enabled_executors() -> Optional[Set[str]]:
+    # PSIJ_ENABLE is an optional comma separated list of executor names; if set, only executors
+    # named in it (or having an alias in it) are registered. Launchers are not filtered, since
+    # executors pick them based on job specs.
+    value = os.environ.get('PSIJ_ENABLE')
+    if value is None:
+        return None
+    return {name.strip().lower() for name in value.split(',') if name.strip()}
+
+
+_ENABLED_EXECUTORS = _get_enabled_executors()
+
+
+def _is_enabled(desc: Descriptor) -> bool:
+    if _ENABLED_EXECUTORS is None:
+        return True
+    if desc.name in _ENABLED_EXECUTORS:
+        return True
+    return desc.aliases is not None and any(alias in _ENABLED_EXECUTORS for alias in desc.aliases)
+
+
 TYPES = [_PluginType('executors', JobExecutor.register_executor),
          _PluginType('launchers', Launcher.register_launcher)]
 
@@ -48,7 +71,7 @@ TYPES = [_PluginType('executors', JobExecutor.register_executor),
 def _load_plugins(root: str, full_path: str, mod: pkgutil.ModuleInfo) -> None:
     if mod.ispkg:
         return
-    logger.debug('Attempting to load %s from %s', mod.name, path)
+    logger.debug('Attempting to load %s from %s', mod.name, full_path)
     spec = mod.module_finder.find_spec(mod.name, None)
     try:
         if spec is None:
@@ -58,42 +81,81 @@ def _load_plugins(root: str, full_path: str, mod: pkgutil.ModuleInfo) -> None:
         full_mod_path = spec.origin
 
         for _type in TYPES:
-            var_name = '__PSI_J_{}__'.format(_type.name.upper())
-            if hasattr(im, var_name):
-                classes = getattr(im, var_name)
-                logger.debug('Found module "{}" with classes {}'.format(mod.name, classes))
+            if hasattr(im, _type.var_name):
+                classes = getattr(im, _type.var_name)
+                logger.debug('Found module "%s" with classes %s', mod.name, classes)
                 for cls in classes:
                     if isinstance(cls, type) and issubclass(cls, JobExecutor):
-                        logger.warning('Not loading old style executor in %s' %
-                                       full_mod_path)
+                        logger.warning('Not loading old style executor in %s', full_mod_path)
                     elif isinstance(cls, type) and issubclass(cls, Launcher):
-                        logger.warning('Not loading old style launcher in %s' %
-                                       full_mod_path)
+                        logger.warning('Not loading old style launcher in %s', full_mod_path)
                     elif isinstance(cls, Descriptor):
-                        logger.debug('Registering {}'.format(cls))
+                        if _type.name == 'executors' and not _is_enabled(cls):
+                            logger.debug('Skipping %s, which is not in PSIJ_ENABLE', cls)
+                            continue
+                        logger.debug('Registering %s', cls)
                         cls.path = full_mod_path
                         _type.registration_method(cls, root)
                     else:
                         logger.warning('Cannot load plugin. Expected an instance of '
-                                       'Descriptor in %s' % full_mod_path)
+                                       'Descriptor in %s', full_mod_path)
     except Exception as ex:
-        logger.warning('Could not import %s: %s' % (full_mod_path, ex))
+        logger.warning('Could not import %s: %s', full_mod_path, ex)
         logger.debug(ex, exc_info=True)
 
 
 def _find_plugins(root: str, path: str) -> None:
     full_path = '/'.join([path] + PACKAGE)
+    # most sys.path entries have no descriptors; a single stat() avoids having pkgutil create
+    # (and cache in sys.path_importer_cache) a finder for each of them
+    if not os.path.isdir(full_path):
+        return
     for mod in pkgutil.iter_modules(path=[full_path]):
         _load_plugins(root, full_path, mod)
 
 
-seen_paths = set()
+_discovery_lock = threading.RLock()
+_discovery_started = False
+_discovery_done = False
+
 
+def _discover_plugins() -> None:
+    """
+    Finds and registers all plugins in `sys.path`, unless already done.
 
-for path in sys.path:
-    path = os.path.realpath(path)
-    if path in seen_paths:
-        logger.info('Ignoring duplicate entry in sys.path: {}'.format(path))
-        continue
-    seen_paths.add(path)
-    _find_plugins(path, path)
+    This is invoked on first use of the plugin registries (e.g., by
+    :meth:`~psij.JobExecutor.get_instance`) rather than when `psij` is imported.
+    """
+    global _discovery_started, _discovery_done
+
+    if _discovery_done:
+        return
+    with _discovery_lock:
+        # _discovery_started prevents recursion if a descriptor module uses the registries
+        if _discovery_started:
+            return
+        _discovery_started = True
+        try:
+            seen_paths = set()
+            for path in sys.path:
+                # identify directories by device and inode, which needs a single stat() rather
+                # than resolving every path component like realpath() does
+                try:
+                    st = os.stat(path or '.')
+                except OSError:
+                    continue
+                if (st.st_dev, st.st_ino) in seen_paths:
+                    logger.info('Ignoring duplicate entry in sys.path: %s', path)
+                    continue
+                seen_paths.add((st.st_dev, st.st_ino))
+                # plugin classes are loaded lazily, so the root must not depend on the current
+                # directory
+                path = os.path.abspath(path)
+                _find_plugins(path, path)
+            if _ENABLED_EXECUTORS is not None:
+                unknown = _ENABLED_EXECUTORS - JobExecutor._executors.keys()
+                if unknown:
+                    logger.warning('No executor found for the following names in PSIJ_ENABLE: '
+                                   '%s', ', '.join(sorted(unknown)))
+        finally:
+            _discovery_done = True
@@ -1,20 +1,27 @@
 import importlib
 import logging
+import threading
 from bisect import bisect_left
+from functools import lru_cache
 from packaging.specifiers import SpecifierSet
 from types import ModuleType
-from typing import Tuple, Dict, List, Union, Type, Any, Optional, TypeVar
+from typing import Tuple, Dict, List, Any, Optional, TypeVar, Union, Set
 
 from psij.descriptor import Descriptor, _VersionEntry
 
 logger = logging.getLogger(__name__)
 
-
-def _getfile(o: Optional[Union[Type[Any], ModuleType]]) -> str:
-    if o is None:
-        return ''
-    else:
-        return o.__psij_file__  # type: ignore
+# guards _module_locks
+_locks_lock = threading.Lock()
+# one lock per plugin module path, held while the module is executed, so that loading a plugin
+# does not hold up lookups of other plugins; the locks are reentrant, such that plugin code can
+# look up other plugins while it is being loaded
+_module_locks: Dict[str, threading.RLock] = {}
+# paths of modules currently being executed
+_loading: Set[str] = set()
+# plugin modules (or the error message if loading them failed) by path, so that descriptors
+# sharing a module do not each execute it again
+_modules: Dict[str, Union[ModuleType, str]] = {}
 
 
 def _split_cls_name(cls: str) -> Tuple[str, str]:
@@ -31,7 +38,9 @@ def _register_plugin(desc: Descriptor, root_path: str, type: str,
     Registers a class with a certain base class through a :class:`~psij.Descriptor`.
 
     This is used internally to dynamically find and register :class:`~psij.JobExecutor` and
-    :class:`~psij.Launcher` classes.
+    :class:`~psij.Launcher` classes. The module containing the class is not loaded here, but
+    when the class is first needed (see :func:`_ensure_loaded`), such that plugins that are never
+    used do not cost anything beyond reading their descriptors.
 
     Parameters
     ----------
@@ -42,43 +51,94 @@ def _register_plugin(desc: Descriptor, root_path: str, type: str,
     store:
         a dictionary where the registered plugins are being stored
     """
-    module, cls_name = _split_cls_name(desc.cls)
-    cls: Optional[Type[Any]] = None
-    exc = None
+    module, _ = _split_cls_name(desc.cls)
     mod_path = root_path + '/' + module.replace('.', '/') + '.py'
-    try:
-        spec = importlib.util.spec_from_file_location(module, mod_path)
-        if spec is None:
-            raise Exception('Failed to load %s' % mod_path)
-        mod = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(mod)  # type: ignore
-        cls = getattr(mod, cls_name)
-        cls.__psij_file__ = mod_path  # type: ignore
-    except Exception as ex:
-        s = str(ex)
-        logger.info(s)
-        exc = ex
-
-    entry: _VersionEntry[T] = _VersionEntry(desc=desc, plugin_path=mod_path, ecls=cls, exc=exc)
-
-    _insert(store, desc.name, type, entry, desc, cls)
+
+    entry: _VersionEntry[T] = _VersionEntry(desc=desc, plugin_path=mod_path)
+
+    _insert(store, desc.name, type, entry, desc)
     if desc.aliases is not None:
         for alias in desc.aliases:
-            _insert(store, alias, type, entry, desc, cls)
+            _insert(store, alias, type, entry, desc)
+
+
+def _ensure_loaded(entry: _VersionEntry[T]) -> None:
+    """
+    Loads the class of a registered plugin, unless already done.
+
+    If loading fails, the exception is stored in the `exc` attribute of the entry and the
+    failure is reported on every later attempt to use the plugin. Since plugin modules are
+    only loaded when first needed, errors in them surface then rather than when `psij` is
+    imported.
+    """
+    if entry.ecls is not None or entry.exc is not None:
+        return
+    module, cls_name = _split_cls_name(entry.desc.cls)
+    mod_path = entry.plugin_path
+    assert mod_path is not None
+    with _module_lock(mod_path):
+        if entry.ecls is not None or entry.exc is not None:
+            return
+        if mod_path in _loading:
+            # the module, while being loaded, asked for a plugin defined in the same module
+            raise Exception('Circular reference to %s while loading %s' %
+                            (entry.desc.cls, mod_path))
+        try:
+            mod = _load_module(module, mod_path)
+            cls = getattr(mod, cls_name)
+            cls.__psij_file__ = mod_path
+            entry.ecls = cls
+        except Exception as ex:
+            s = str(ex)
+            logger.info(s)
+            entry.exc = ex
+
+
+def _module_lock(mod_path: str) -> threading.RLock:
+    with _locks_lock:
+        lock = _module_locks.get(mod_path)
+        if lock is None:
+            lock = threading.RLock()
+            _module_locks[mod_path] = lock
+        return lock
+
+
+def _load_module(module: str, mod_path: str) -> ModuleType:
+    mod = _modules.get(mod_path)
+    if isinstance(mod, str):
+        # An earlier attempt failed. Only its message is kept, since the exception would keep
+        # the frames of the failed module alive; the exception itself is stored in the entry
+        # that caused the module to be loaded.
+        raise Exception('Failed to load %s: %s' % (mod_path, mod))
+    if mod is None:
+        try:
+            spec = importlib.util.spec_from_file_location(module, mod_path)
+            if spec is None:
+                raise Exception('Failed to load %s' % mod_path)
+            mod = importlib.util.module_from_spec(spec)
+            _loading.add(mod_path)
+            try:
+                spec.loader.exec_module(mod)  # type: ignore
+            finally:
+                _loading.discard(mod_path)
+        except Exception as ex:
+            _modules[mod_path] = str(ex)
+            raise
+        _modules[mod_path] = mod
+    return mod
 
 
 def _insert(store: Dict[str, List[_VersionEntry[T]]], name: str, type: str, entry: _VersionEntry[T],
-            desc: Descriptor, cls: Optional[Type[T]]) -> None:
-    name = desc.name.lower()
+            desc: Descriptor) -> None:
     if name not in store:
         store[name] = []
     existing = store[name]
 
     # check if an object with this version already exists
     index = bisect_left(existing, entry)
-    if index != len(existing) and existing[index].version == desc.version:
-        p1 = _getfile(existing[index].ecls)
-        p2 = _getfile(cls)
+    if index != len(existing) and existing[index] == entry:
+        p1 = existing[index].plugin_path
+        p2 = entry.plugin_path
         if p1 == p2:
             # can happen if PYTHONPATH has, e.g., a/, a/b/, so ignore silently
             return
@@ -96,6 +156,7 @@ def _insert(store: Dict[str, List[_VersionEntry[T]]], name: str, type: str, entr
 def _print_plugin_status(store: Dict[str, List[_VersionEntry[T]]], type: str) -> None:
     for k, v in store.items():
         for ve in v:
+            _ensure_loaded(ve)
             print('%s %s %s:\n'
                   '\tdescriptor: %s\n'
                   '\t    plugin: %s\n'
@@ -107,6 +168,11 @@ def _get_names(store: Dict[str, Any]) -> str:
     return ', '.join(filter(lambda x: x[0] != '_', store.keys()))
 
 
+@lru_cache(maxsize=256)
+def _parse_version_constraint(version_constraint: str) -> SpecifierSet:
+    return SpecifierSet(version_constraint)
+
+
 def _get_plugin_class(name: str, version_constraint: Optional[str], type: str,
                       store: Dict[str, List[_VersionEntry[T]]]) -> _VersionEntry[T]:
     name = name.lower()
@@ -116,7 +182,7 @@ def _get_plugin_class(name: str, version_constraint: Optional[str], type: str,
     versions = store[name]
     selected = None
     if version_constraint:
-        pred = SpecifierSet(version_constraint)
+        pred = _parse_version_constraint(version_constraint)
         for entry in reversed(versions):
             if entry.version in pred:
                 selected = entry
@@ -125,7 +191,8 @@ def _get_plugin_class(name: str, version_constraint: Optional[str], type: str,
 
     if selected is None:
         raise ValueError('No {} "{}" found to satisfy "{}"'.format(type, name, version_constraint))
-    elif selected.exc is not None:
+    _ensure_loaded(selected)
+    if selected.exc is not None:
         raise ValueError('Unable to load {} {}'.format(type, name)) from selected.exc
     else:
         return selected
@@ -13,15 +13,18 @@ class _VersionEntry(Generic[T]):
                  exc: Optional[Exception] = None) -> None:
         self.desc = desc
         self.version = desc.version
+        # Version comparisons go through Version._key; keep a reference to it to avoid
+        # the extra calls when sorting and searching entries
+        self._key = desc.version._key
         self.desc_path = desc.path
         self.plugin_path = plugin_path
         self.ecls = ecls
         self.exc = exc
 
     def __cmp__(self, other: '_VersionEntry[T]') -> int:
-        if self.version == other.version:
+        if self._key == other._key:
             return 0
-        elif self.version < other.version:
+        elif self._key < other._key:
             return -1
         else:
             return 1
@@ -29,17 +32,17 @@ class _VersionEntry(Generic[T]):
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, _VersionEntry):
             return False
-        return self.version == other.version
+        return self._key == other._key
 
     def __lt__(self, other: object) -> bool:
         if not isinstance(other, _VersionEntry):
             return NotImplemented
-        return self.version < other.version
+        return self._key < other._key
 
     def __gt__(self, other: object) -> bool:
         if not isinstance(other, _VersionEntry):
             return NotImplemented
-        return self.version > other.version
+        return self._key > other._key
 
 
 class Descriptor(object):
@@ -113,11 +116,12 @@ class Descriptor(object):
             a user. For example, a nice name for `pbs` would be `PBS` or `Portable Batch System`.
             If not specified, the `nice_name` defaults to the value of the `name` parameter.
         """
-        self.name = name
+        # names are case insensitive; normalize them here rather than on every lookup
+        self.name = name.lower()
         self.version = version
         self.cls = cls
         self.path: Optional[str] = None
-        self.aliases = aliases
+        self.aliases = [alias.lower() for alias in aliases] if aliases is not None else None
         self.nice_name = nice_name if nice_name is not None else name
 
     def __repr__(self) -> str:
@@ -9,7 +9,6 @@ github.com/flux-framework/rfc/blob/master/spec_21.rst
 """
 
 import time
-import copy
 import warnings
 import concurrent.futures
 from functools import partial
@@ -50,6 +49,7 @@ class FluxJobExecutor(JobExecutor):
         # 'clean': None,
         # 'exception': JobState.FAILED
     }
+    _events = tuple(_event_map.keys())
 
     def __init__(
         self, url: Optional[str] = None, config: Optional[JobExecutorConfig] = None
@@ -81,7 +81,7 @@ class FluxJobExecutor(JobExecutor):
         Update the status of the psij.Job.
         """
         jpsi_state = self._event_map[evt.name]
-        metadata = copy.deepcopy(evt.context)
+        metadata = dict(evt.context)
         job_status = JobStatus(jpsi_state, time=time.time(), metadata=metadata)
         self._set_job_status(job, job_status)
 
@@ -114,7 +114,7 @@ class FluxJobExecutor(JobExecutor):
     def _add_flux_callbacks(self, job: Job, fut: flux.job.FluxExecutorFuture) -> None:
         """Add jobid, event, and done callbacks to a Flux future."""
         fut.add_jobid_callback(partial(self._jobid_cb, job))
-        for event in self._event_map.keys():
+        for event in self._events:
             fut.add_event_callback(event, partial(self._event_cb, job))
         fut.add_done_callback(partial(self._done_cb, job))
         # add future to cache
@@ -165,7 +165,9 @@ class FluxJobExecutor(JobExecutor):
         """See :func:`~psij.job_executor.JobExecutor.cancel`."""
         fut = self._futures[job]
         if not fut.cancel():
-            flux.job.cancel_async(self._fh, fut.jobid())
+            # the ID is cached on the job by _jobid_cb; fut.jobid() blocks until it is available
+            flux_id = job._native_id if job._native_id is not None else fut.jobid()
+            flux.job.cancel_async(self._fh, flux_id)
 
     def list(self) -> List[str]:
         """See :func:`~psij.job_executor.JobExecutor.list`.
@@ -34,14 +34,31 @@ def _handle_sigchld(signum: int, frame: Optional[FrameType]) -> None:
     _ProcessReaper.get_instance()._handle_sigchld()
 
 
-if threading.current_thread() != threading.main_thread():
-    logger.warning('The psij module is being imported from a non-main thread. This prevents the'
-                   'use of signals in the local executor, which will slow things down a bit.')
-else:
+_sigchld_installed = False
+
+
+def _install_sigchld_handler() -> None:
+    # Signal handlers can only be installed from the main thread. This module is loaded when the
+    # local executor is first requested, which may happen on any thread, so this is attempted
+    # again whenever an executor is created.
+    global _sigchld_installed
+    if _sigchld_installed or threading.current_thread() != threading.main_thread():
+        return
     signal.signal(signal.SIGCHLD, _handle_sigchld)
+    _sigchld_installed = True
+
+
+_install_sigchld_handler()
+if not _sigchld_installed:
+    logger.warning('The local executor is being loaded from a non-main thread. This prevents the '
+                   'use of signals in the local executor until an executor is created from the '
+                   'main thread, which will slow things down a bit.')
 
 
 _REAPER_SLEEP_TIME = 0.1
+_REAPER_SHARDS = 8
+# how often attached processes are checked for having become zombies or having had their PID reused
+_ATTACHED_CHECK_INTERVAL = 1.0
 
 
 class _ProcessEntry(ABC):
@@ -101,20 +118,38 @@ class _AttachedProcessEntry(_ProcessEntry):
     def __init__(self, job: Job, process: psutil.Process, executor: 'LocalJobExecutor'):
         super().__init__(job, executor, None)
         self.process = process
+        self._next_check = 0.0
 
     def kill(self) -> None:
         super().kill()
 
     def poll(self) -> Tuple[Optional[int], Optional[str]]:
+        # Attached processes are generally not our children, so the exit code is not available.
+        # A signal 0 is enough to tell that a process with this PID exists.
+        process = cast(psutil.Process, self.process)
         try:
-            assert self.process
-            ec: Optional[int] = self.process.wait(timeout=0)
-            if ec is None:
-                return 0, None
-            else:
-                return ec, None
-        except psutil.TimeoutExpired:
+            os.kill(process.pid, 0)
+        except ProcessLookupError:
+            return 0, None
+        except PermissionError:
+            # the process exists, but belongs to someone else
+            pass
+        # The PID may, however, belong to a zombie or to a different process that reused it.
+        # Telling these apart needs psutil, which is more expensive, so it is done less often.
+        now = time.monotonic()
+        if now < self._next_check:
+            return None, None
+        self._next_check = now + _ATTACHED_CHECK_INTERVAL
+        try:
+            # is_running() compares the creation time, which catches a reused PID; a zombie is
+            # done, and, if it is our child, it is left to be reaped by whoever started it
+            if process.is_running() and process.status() != psutil.STATUS_ZOMBIE:
+                return None, None
+        except psutil.NoSuchProcess:
+            pass
+        except psutil.AccessDenied:
             return None, None
+        return 0, None
 
 
 def _get_env(spec: JobSpec, nodefile: Optional[str]) -> Optional[Dict[str, str]]:
@@ -151,31 +186,61 @@ class _ProcessReaper(SingletonThread):
 
     def __init__(self) -> None:
         super().__init__(name='Local Executor Process Reaper', daemon=True)
-        self._jobs: Dict[Job, _ProcessEntry] = {}
-        self._lock = threading.RLock()
+        # jobs are striped across shards, each with its own lock, so that concurrent calls to
+        # register() and cancel() do not all contend on the same lock; the locks only guard
+        # structural changes, since polling is done on a snapshot
+        self._shards: List[Tuple[threading.Lock, Dict[Job, _ProcessEntry]]] = \
+            [(threading.Lock(), {}) for _ in range(_REAPER_SHARDS)]
         self._cvar = threading.Condition()
+        self._idle = False
 
     def register(self, entry: _ProcessEntry) -> None:
         logger.debug('Registering process %s', entry)
-        with self._lock:
-            self._jobs[entry.job] = entry
+        lock, jobs = self._shard(entry.job)
+        with lock:
+            jobs[entry.job] = entry
+
+    def _shard(self, job: Job) -> Tuple[threading.Lock, Dict[Job, _ProcessEntry]]:
+        return self._shards[hash(job) % _REAPER_SHARDS]
 
     def run(self) -> None:
         logger.debug('Started {}'.format(self))
         done: List[_ProcessEntry] = []
         while True:
-            with self._lock:
-                for entry in done:
-                    del self._jobs[entry.job]
-                jobs = dict(self._jobs)
+            for entry in done:
+                lock, jobs = self._shard(entry.job)
+                with lock:
+                    del jobs[entry.job]
+            entries: List[_ProcessEntry] = []
+            for lock, jobs in self._shards:
+                with lock:
+                    entries.extend(jobs.values())
             try:
-                done = self._check_processes(jobs)
+                done = self._check_processes(entries)
             except Exception as ex:
                 logger.error('Error polling for process status', ex)
             with self._cvar:
-                self._cvar.wait(_REAPER_SLEEP_TIME)
+                if any(jobs for _, jobs in self._shards):
+                    # SIGCHLD wakes us up early, but we still poll, since attached processes are
+                    # not our children and signals are not available in all cases
+                    self._cvar.wait(_REAPER_SLEEP_TIME)
+                else:
+                    # nothing to poll; the executor calls wake() after registering a process
+                    self._idle = True
+                    self._cvar.wait()
+                    self._idle = False
 
     def _handle_sigchld(self) -> None:
+        self._notify()
+
+    def wake(self) -> None:
+        # only needed when idle; otherwise, the next poll happens within _REAPER_SLEEP_TIME anyway
+        # and polling right after a submit() can race with an immediate cancel()
+        with self._cvar:
+            if self._idle:
+                self._notify()
+
+    def _notify(self) -> None:
         with self._cvar:
             try:
                 self._cvar.notify_all()
@@ -192,10 +257,10 @@ class _ProcessReaper(SingletonThread):
                 # there is really no telling what else could go wrong.
                 logger.debug('Exception in Condition.notify_all()')
 
-    def _check_processes(self, jobs: Dict[Job, _ProcessEntry]) -> List[_ProcessEntry]:
+    def _check_processes(self, entries: List[_ProcessEntry]) -> List[_ProcessEntry]:
         done: List[_ProcessEntry] = []
 
-        for entry in jobs.values():
+        for entry in entries:
             if entry.kill_flag:
                 entry.kill()
 
@@ -212,9 +277,11 @@ class _ProcessReaper(SingletonThread):
         return done
 
     def cancel(self, job: Job) -> None:
-        with self._lock:
-            p = self._jobs[job]
-            p.kill_flag = True
+        lock, jobs = self._shard(job)
+        with lock:
+            p = jobs[job]
+        # a plain flag write; the reaper thread acts on it during its next poll
+        p.kill_flag = True
 
 
 class LocalJobExecutor(JobExecutor):
@@ -245,7 +312,9 @@ class LocalJobExecutor(JobExecutor):
         :type config: psij.JobExecutorConfig
         """
         super().__init__(url=url, config=config if config else JobExecutorConfig())
+        _install_sigchld_handler()
         self._reaper = _ProcessReaper.get_instance()
+        self._uid = os.getuid()
 
     def _generate_nodefile(self, job: Job, p: _ChildProcessEntry) -> Optional[str]:
         assert job.spec is not None
@@ -297,9 +366,14 @@ class LocalJobExecutor(JobExecutor):
                                          close_fds=True, cwd=spec.directory, env=env)
             self._reaper.register(p)
             job._native_id = p.process.pid
-            self._set_job_status(job, JobStatus(JobState.QUEUED, time=time.time(),
+            # the process is already running, so both transitions happen at the same time
+            now = time.time()
+            self._set_job_status(job, JobStatus(JobState.QUEUED, time=now,
                                                 metadata={'nativeId': job._native_id}))
-            self._set_job_status(job, JobStatus(JobState.ACTIVE, time=time.time()))
+            self._set_job_status(job, JobStatus(JobState.ACTIVE, time=now))
+            # only wake the reaper once the job is ACTIVE, so that a quick exit cannot race with
+            # the status updates above
+            self._reaper.wake()
         except Exception as ex:
             raise SubmitException('Failed to submit job', exception=ex)
 
@@ -343,9 +417,18 @@ class LocalJobExecutor(JobExecutor):
         :return: The list of `~psij.NativeId` objects corresponding to the current user's
             processes running locally.
         """
-        my_username = psutil.Process().username()
-        return [str(p.pid) for p in psutil.process_iter(['pid', 'username'])
-                if p.info['username'] == my_username]
+        # compare numeric uids rather than user names, which would require a passwd lookup for
+        # every process
+        uid = self._uid
+        pids = []
+        for pid in psutil.pids():
+            try:
+                if psutil.Process(pid).uids().real == uid:
+                    pids.append(str(pid))
+            except psutil.Error:
+                # process is gone or not accessible
+                pass
+        return pids
 
     def attach(self, job: Job, native_id: str) -> None:
         """
@@ -364,12 +447,28 @@ class LocalJobExecutor(JobExecutor):
         job.executor = self
         pid = int(native_id)
 
-        self._reaper.register(_AttachedProcessEntry(job, psutil.Process(pid), self))
         # We assume that the native_id above is a PID that was obtained at some point using
-        # list(). If so, the process is either still running or has completed. Either way, we must
-        # bring it up to ACTIVE state
-        self._set_job_status(job, JobStatus(JobState.QUEUED, time=time.time()))
+        # list(). If so, the process is either still running or has completed. A PID that does
+        # not exist is an error, as it is more likely to be a wrong ID than a completed job.
+        process = psutil.Process(pid)
+        try:
+            running = process.status() != psutil.STATUS_ZOMBIE
+        except psutil.NoSuchProcess:
+            # it existed above, so it has just completed
+            running = False
+        except psutil.AccessDenied:
+            running = True
+        if not running:
+            # there is nothing to poll; go straight to the final state, which, as with other
+            # attached jobs, is reported with a zero exit code
+            self._set_job_status(job, JobStatus(JobState.COMPLETED, time=time.time(),
+                                                exit_code=0))
+            return
+
+        self._reaper.register(_AttachedProcessEntry(job, process, self))
+        # intermediate states are filled in by the status setter
         self._set_job_status(job, JobStatus(JobState.ACTIVE, time=time.time()))
+        self._reaper.wake()
 
     def _get_launcher_name(self, spec: JobSpec) -> str:
         if spec.launcher is None:
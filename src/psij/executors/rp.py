@@ -2,6 +2,7 @@
 
 import time
 import logging
+import threading
 
 from typing import Any, Optional, List, Tuple, Dict
 
@@ -26,6 +27,7 @@ class RPJobExecutor(JobExecutor):
                   _rp.DONE: JobState.COMPLETED,
                   _rp.FAILED: JobState.FAILED,
                   _rp.CANCELED: JobState.CANCELED}
+    _final_states = frozenset(_rp.FINAL)
 
     def __init__(self, url: Optional[str] = None,
                  config: Optional[JobExecutorConfig] = None) -> None:
@@ -45,13 +47,20 @@ class RPJobExecutor(JobExecutor):
         self._pmgr.register_callback(self._pilot_state_cb)
         self._tmgr.register_callback(self._task_state_cb)
 
-        pd = self._rp.PilotDescription({'resource': 'local.localhost',
-                                        'cores': 32,
-                                        'runtime': 15})
-        self._pilot = self._pmgr.submit_pilots(pd)
-        self._tmgr.add_pilots(self._pilot)
+        self._pd = self._rp.PilotDescription({'resource': 'local.localhost',
+                                              'cores': 32,
+                                              'runtime': 15})
+        # the pilot is only submitted when first needed, since doing so can take a while
+        self._pilot: Optional[Any] = None
+        self._pilot_lock = threading.Lock()
         self._tasks: Dict[str, Tuple[Any, Any]] = dict()
 
+    def _ensure_pilot(self) -> None:
+        with self._pilot_lock:
+            if self._pilot is None:
+                self._pilot = self._pmgr.submit_pilots(self._pd)
+                self._tmgr.add_pilots(self._pilot)
+
     def _pilot_state_cb(self, pilot: _rp.Pilot, rp_state: str) -> None:
 
         logger.info('pilot %s: %s', pilot.uid, pilot.state)
@@ -60,15 +69,17 @@ class RPJobExecutor(JobExecutor):
 
         jpsi_uid = task.name
         jpsi_job = self._tasks[jpsi_uid][0]
+        rp_task_state = task.state
+        final = rp_task_state in self._final_states
 
         ec = None
-        if task.state in self._rp.FINAL:
+        if final:
             ec = task.exit_code
 
         old_state = jpsi_job.status.state
-        new_state = self._state_map.get(task.state)
+        new_state = self._state_map.get(rp_task_state)
 
-        logger.debug('%s --> %s - %s', jpsi_uid, task.state, new_state)
+        logger.debug('%s --> %s - %s', jpsi_uid, rp_task_state, new_state)
 
         if new_state is None:
             # not an interesting state transition, ignore
@@ -82,7 +93,7 @@ class RPJobExecutor(JobExecutor):
         if ec:
             metadata['exit_code'] = ec
 
-        if task.state in self._rp.FINAL:
+        if final:
             metadata['final'] = True
 
         status = JobStatus(new_state, time=time.time(),
@@ -105,6 +116,7 @@ class RPJobExecutor(JobExecutor):
         self._check_job(job)
 
         try:
+            self._ensure_pilot()
             td = self._job_2_descr(job)
             task = self._tmgr.submit_tasks(td)
             self._tasks[job.id] = (job, task)
@@ -174,6 +186,7 @@ class RPJobExecutor(JobExecutor):
             raise InvalidJobException('Job must be in the NEW state')
 
         job.executor = self
+        self._ensure_pilot()
 
         task = self._tmgr.get_tasks(uids=[native_id])[0]
         self._tasks[job.id] = (job, task)
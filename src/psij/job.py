@@ -103,7 +103,9 @@ class Job(object):
                 return
             prev = JobStateOrder.prev(nxt)
         if prev is not None and prev != crt:
-            self.status = JobStatus(prev)
+            # the skipped state is reported as having occurred together with the target one, so
+            # that times do not go backwards
+            self.status = JobStatus(prev, time=status.time)
         logger.debug('Job status change %s: %s -> %s', self, self._status.state, status.state)
         with self._status_cv:
             self._status = status
@@ -1,7 +1,7 @@
 import logging
 from abc import ABC, abstractmethod
 from packaging.version import Version
-from threading import RLock
+from threading import Lock
 from typing import Optional, Dict, List, Type, cast, Union, Callable, Set
 
 import psij
@@ -40,7 +40,7 @@ class JobExecutor(ABC):
         self.config = config
         # _cb is not thread-safe; changing it while jobs are running could lead to badness
         self._cb: Optional[JobStatusCallback] = None
-        self._launchers_lock = RLock()
+        self._launchers_lock = Lock()
         self._launchers: Dict[str, Launcher] = {}
 
     @property
@@ -229,6 +229,7 @@ class JobExecutor(ABC):
         :return: A JobExecutor.
         """
         # might want to cache these instances if url and config match
+        psij._discover_plugins()
         selected = _get_plugin_class(name, version_constraint, 'executor', JobExecutor._executors)
 
         assert selected.ecls is not None
@@ -260,6 +261,7 @@ class JobExecutor(ABC):
 
     @staticmethod
     def _print_plugin_status() -> None:
+        psij._discover_plugins()
         _print_plugin_status(JobExecutor._executors, 'executor')
 
     @staticmethod
@@ -280,9 +282,14 @@ class JobExecutor(ABC):
         -------
         A set of executor names corresponding to the known executors.
         """
+        psij._discover_plugins()
         return set(JobExecutor._executors.keys())
 
     def _get_launcher(self, name: str, version_constraint: Optional[str] = None) -> Launcher:
+        # launchers are only ever added, so a hit does not need the lock
+        launcher = self._launchers.get(name)
+        if launcher is not None:
+            return launcher
         with self._launchers_lock:
             if name not in self._launchers:
                 self._launchers[name] = Launcher.get_instance(name,
@@ -70,4 +70,15 @@ class JobExecutorConfig(object):
         self._work_directory = Path(value)
 
 
-JobExecutorConfig.DEFAULT = JobExecutorConfig()
+class _DefaultJobExecutorConfig(JobExecutorConfig):
+    # The default configuration is shared by all launchers that are not given an explicit one,
+    # so changes to it would silently leak into all of them.
+
+    def __setattr__(self, name: str, value: object) -> None:
+        if not name.startswith('_'):
+            raise AttributeError('The default JobExecutorConfig cannot be modified. Pass a new '
+                                 'JobExecutorConfig instance instead.')
+        super().__setattr__(name, value)
+
+
+JobExecutorConfig.DEFAULT = _DefaultJobExecutorConfig()
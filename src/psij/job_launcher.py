@@ -3,6 +3,7 @@
 from abc import ABC, abstractmethod
 from typing import Optional, List, Dict, Set
 
+import psij
 from psij.descriptor import Descriptor, _VersionEntry
 from psij._plugins import _register_plugin, _get_plugin_class, _print_plugin_status
 from psij.job_executor_config import JobExecutorConfig
@@ -83,6 +84,7 @@ class Launcher(ABC):
         :param config: An optional configuration.
         :return: A launcher instance.
         """
+        psij._discover_plugins()
         selected = _get_plugin_class(name, version_constraint, 'launcher', Launcher._launchers)
 
         assert selected.ecls is not None
@@ -114,6 +116,7 @@ class Launcher(ABC):
 
     @staticmethod
     def _print_plugin_status() -> None:
+        psij._discover_plugins()
         _print_plugin_status(Launcher._launchers, 'launcher')
 
     @staticmethod
@@ -128,4 +131,5 @@ class Launcher(ABC):
         -------
         A set of launcher names corresponding to the known executors.
         """
+        psij._discover_plugins()
         return set(Launcher._launchers.keys())
@@ -36,6 +36,11 @@ def _to_env_dict(arg: Union[Dict[str, Union[str, int]], None]) -> Optional[Dict[
 class JobSpec(object):
     """A class that describes the details of a job."""
 
+    # there can be many job specifications around, so avoid a __dict__ for each
+    __slots__ = ('_name', 'executable', 'arguments', '_directory', 'inherit_environment',
+                 '_environment', '_stdin_path', '_stdout_path', '_stderr_path', 'resources',
+                 'attributes', '_pre_launch', '_post_launch', 'launcher')
+
     @typechecked
     def __init__(self, executable: Optional[str] = None, arguments: Optional[List[str]] = None,
                  # For some odd reason, and only in the constructor, if Path is used directly,
@@ -1,14 +1,22 @@
 """A module containing the `MultipleLauncher`."""
 
 from pathlib import Path
-from typing import List, cast, Optional
+from typing import Callable, Dict, List, cast, Optional
 
 from psij.job import Job
 from psij.job_executor_config import JobExecutorConfig
 from psij.launchers.script_based_launcher import ScriptBasedLauncher
 from psij.resource_spec import ResourceSpec, ResourceSpecV1
 
-SCRIPT_PATH = Path(__name__).parent / 'scripts' / 'multi_launch.sh'
+SCRIPT_PATH = Path(__file__).parent / 'scripts' / 'multi_launch.sh'
+
+
+def _get_count_v1(res: ResourceSpec) -> int:
+    return cast(ResourceSpecV1, res).computed_process_count
+
+
+# process count getters indexed by resource spec version
+_COUNT_GETTERS: Dict[int, Callable[[ResourceSpec], int]] = {1: _get_count_v1}
 
 
 class MultipleLauncher(ScriptBasedLauncher):
@@ -19,8 +27,7 @@ class MultipleLauncher(ScriptBasedLauncher):
     executable copies or zero if all invocations of the executable succeed.
     """
 
-    def __init__(self, script_path: Path = Path(__file__).parent / 'scripts' / 'multi_launch.sh',
-                 config: Optional[JobExecutorConfig] = None):
+    def __init__(self, script_path: Path = SCRIPT_PATH, config: Optional[JobExecutorConfig] = None):
         """
         Parameters
         ----------
@@ -39,9 +46,8 @@ class MultipleLauncher(ScriptBasedLauncher):
     def _get_count(self, res: Optional[ResourceSpec]) -> int:
         if res is None:
             return 1
-        if res.version == 1:
-            res1 = cast(ResourceSpecV1, res)
-            return res1.computed_process_count
-        else:
+        getter = _COUNT_GETTERS.get(res.version)
+        if getter is None:
             raise ValueError('This launcher cannot handle resource specs with version {}'.
                              format(res.version))
+        return getter(res)
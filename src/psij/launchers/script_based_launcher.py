@@ -102,12 +102,17 @@ class ScriptBasedLauncher(Launcher):
         self._deployed = False
 
     def _ensure_launcher_deployed(self) -> None:
+        if self._deployed:
+            # set last, after everything else, so no need to lock if already deployed
+            return
         with self._lock:
             if self._deployed:
                 return
 
             deploy_dir = self._deploy_files(self._files_to_deploy())
             self._deployed_script_path = deploy_dir / self._script_path.name
+            # the part of the launch command that is the same for all jobs
+            self._command_prefix = ['/bin/bash', str(self._deployed_script_path)]
             self._deployed = True
 
     def _files_to_deploy(self) -> List[Path]:
@@ -179,16 +184,11 @@ class ScriptBasedLauncher(Launcher):
         if log_file is None:
             log_file = self._log_file
 
-        args = ['/bin/bash', str(self._deployed_script_path), job.id, _str(log_file),
-                _str(spec.pre_launch), _str(spec.post_launch), _path(spec.stdin_path),
-                _path(spec.stdout_path), _path(spec.stderr_path)]
-        args += self.get_additional_args(job)
         assert spec.executable is not None
-        args += [spec.executable]
-        if spec.arguments is not None:
-            args += spec.arguments
-
-        return args
+        return [*self._command_prefix, job.id, _str(log_file), _str(spec.pre_launch),
+                _str(spec.post_launch), _path(spec.stdin_path), _path(spec.stdout_path),
+                _path(spec.stderr_path), *self.get_additional_args(job), spec.executable,
+                *(spec.arguments or ())]
 
     def get_additional_args(self, job: Job) -> List[str]:
         """
@@ -14,11 +14,13 @@ class TestCallbacks(TestCase):
     def __init__(self, arg: Any) -> None:
         """Initialize test case."""
         self._cb_states: List[psij.JobState] = list()
+        self._cb_statuses: List[psij.JobStatus] = list()
         TestCase.__init__(self, arg)
 
     def state_cb(self, job: psij.Job, status: psij.JobStatus) -> None:
         """State callback."""
         self._cb_states.append(status.state)
+        self._cb_statuses.append(status)
 
     def test_job_callbacks(self) -> None:
         """Test :class:`psij.Job` callbacks."""
@@ -59,3 +61,35 @@ class TestCallbacks(TestCase):
         self.assertIn(psij.JobState.QUEUED, self._cb_states)
         self.assertIn(psij.JobState.ACTIVE, self._cb_states)
         self.assertIn(psij.JobState.COMPLETED, self._cb_states)
+
+    def test_job_callback_status_details(self) -> None:
+        """Test the time and metadata of the statuses reported by the local executor."""
+        self._cb_statuses = list()
+        job = psij.Job(psij.JobSpec(executable='/bin/date'))
+        job.set_job_status_callback(self.state_cb)
+        jex = psij.JobExecutor.get_instance(name='local')
+        jex.submit(job)
+        job.wait()
+
+        queued, active = self._cb_statuses[:2]
+        self.assertEqual(queued.state, psij.JobState.QUEUED)
+        self.assertEqual(active.state, psij.JobState.ACTIVE)
+        self.assertLessEqual(queued.time, active.time)
+        assert queued.metadata is not None
+        self.assertEqual(str(queued.metadata['nativeId']), job.native_id)
+
+    def test_job_filled_in_states(self) -> None:
+        """Test the states filled in by :class:`psij.Job` when states are skipped."""
+        self._cb_statuses = list()
+        job = psij.Job(psij.JobSpec(executable='/bin/date'))
+        job.set_job_status_callback(self.state_cb)
+        job.status = psij.JobStatus(psij.JobState.COMPLETED, exit_code=0,
+                                    metadata={'final': True})
+
+        self.assertEqual([s.state for s in self._cb_statuses],
+                         [psij.JobState.QUEUED, psij.JobState.ACTIVE, psij.JobState.COMPLETED])
+        completed = self._cb_statuses[2]
+        for status in self._cb_statuses[:2]:
+            self.assertEqual(status.time, completed.time)
+            self.assertIsNone(status.metadata)
+            self.assertIsNone(status.exit_code)
@@ -1,11 +1,15 @@
 import secrets
+import subprocess
+import time
 import uuid
+from datetime import timedelta
 from pathlib import Path
 from typing import List, Callable, Dict
 
 import pytest
 
-from psij import SubmitException, Job, JobSpec, JobState, JobExecutor, JobAttributes, ResourceSpecV1
+from psij import SubmitException, Job, JobSpec, JobState, JobExecutor, JobAttributes, \
+    ResourceSpecV1, JobExecutorConfig
 from tempfile import TemporaryDirectory, TemporaryFile
 
 from executor_test_params import ExecutorTestParams
@@ -67,6 +71,39 @@ def test_attach2(execparams: ExecutorTestParams) -> None:
     assert_completed(job2, status, attached=True)
 
 
+def test_attach_unreaped_child() -> None:
+    # a child of this process that exits without being waited for becomes a zombie, but the
+    # attached job must still complete
+    p = subprocess.Popen(['/bin/sleep', '1'])
+    try:
+        job = Job()
+        JobExecutor.get_instance('local').attach(job, str(p.pid))
+        status = job.wait(timeout=timedelta(seconds=30))
+        assert status is not None
+        assert status.state == JobState.COMPLETED
+    finally:
+        p.wait()
+
+
+def test_attach_exited_child() -> None:
+    # the process exists, as a zombie, but is no longer running
+    p = subprocess.Popen(['/bin/true'])
+    try:
+        time.sleep(0.5)
+        job = Job()
+        JobExecutor.get_instance('local').attach(job, str(p.pid))
+        assert job.status.state == JobState.COMPLETED
+    finally:
+        p.wait()
+
+
+def test_attach_missing_process() -> None:
+    p = subprocess.Popen(['/bin/true'])
+    p.wait()
+    with pytest.raises(Exception):
+        JobExecutor.get_instance('local').attach(Job(), str(p.pid))
+
+
 def test_cancel(execparams: ExecutorTestParams) -> None:
     job = Job(JobSpec(executable='/bin/sleep', arguments=['60']))
     ex = _get_executor_instance(execparams, job)
@@ -195,7 +232,7 @@ def _check_str_attrs(ex: BatchSchedulerExecutor, job: Job, names: List[str],
                 pytest.fail('Script generation failed for %s' % name)
 
 
-_PREFIX_TR = {'pbspro': 'pbs', 'pbs_classic': 'pbs'}
+_PREFIX_TR = {'pbspro': 'pbs', 'pbs_classic': 'pbs', 'torque': 'pbs'}
 
 
 def _get_attr_prefix(exec_name: str) -> str:
@@ -224,3 +261,19 @@ def test_submit_script_generation(exec_name: str) -> None:
                      lambda k, v: setattr(attrs, k, v))
     _check_str_attrs(ex, job, [prefix + '.cust_attr1', prefix + '.cust_attr2'],
                      lambda k, v: c_attrs.__setitem__(k, v))
+
+
+def test_local_default_config() -> None:
+    # executors created without a config each get their own, modifiable one
+    ex1 = JobExecutor.get_instance('local')
+    ex2 = JobExecutor.get_instance('local')
+    assert ex1.config is not ex2.config
+    with TemporaryDirectory() as td:
+        ex1.config.work_directory = Path(td)
+        assert ex2.config.work_directory != Path(td)
+
+
+def test_default_config_read_only() -> None:
+    with pytest.raises(AttributeError):
+        JobExecutorConfig.DEFAULT.work_directory = Path('/tmp')
+    assert JobExecutorConfig.DEFAULT.work_directory == JobExecutorConfig.DEFAULT_WORK_DIRECTORY
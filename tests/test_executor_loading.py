@@ -1,4 +1,17 @@
+import os
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import pytest
+from packaging.version import Version
+
 from psij import JobExecutor
+from psij._plugins import _register_plugin, _get_plugin_class
+from psij.descriptor import Descriptor, _VersionEntry
 
 
 def test_executor_loading() -> None:
@@ -33,3 +46,162 @@ def test_cross_path_loading3() -> None:
         assert False
     except ValueError as ve:
         assert 'Unable to load executor' in str(ve)
+
+
+def _run_fresh(code: str, env: Optional[Dict[str, str]] = None) \
+        -> 'subprocess.CompletedProcess[str]':
+    # plugin discovery happens once per interpreter, so this needs a fresh one
+    p = subprocess.run([sys.executable, '-c', code], env=env, capture_output=True, text=True)
+    assert p.returncode == 0, p.stderr
+    return p
+
+
+def test_enabled_plugins() -> None:
+    # the filter is read when psij is first imported
+    env = dict(os.environ)
+    env['PSIJ_ENABLE'] = 'local, no-such-executor'
+    p = _run_fresh('import psij\n'
+                   'print(sorted(psij.JobExecutor.get_executor_names()), '
+                   '\'single\' in psij.Launcher.get_launcher_names())\n', env)
+    # launchers are not filtered
+    assert p.stdout.strip() == "['local'] True"
+    assert 'no-such-executor' in p.stderr
+
+
+def test_import_does_not_discover() -> None:
+    _run_fresh('import psij\n'
+               'assert not psij._discovery_started\n'
+               'assert not psij.JobExecutor._executors\n'
+               'assert not psij.Launcher._launchers\n')
+
+
+@pytest.mark.parametrize('call', ['psij.JobExecutor.get_instance(\'local\')',
+                                  'psij.JobExecutor.get_executor_names()',
+                                  'psij.JobExecutor._print_plugin_status()',
+                                  'psij.Launcher.get_instance(\'single\')',
+                                  'psij.Launcher.get_launcher_names()',
+                                  'psij.Launcher._print_plugin_status()'])
+def test_first_use_discovers(call: str) -> None:
+    _run_fresh('import psij\n'
+               '%s\n'
+               'assert psij._discovery_done\n'
+               'assert \'local\' in psij.JobExecutor._executors\n'
+               'assert \'single\' in psij.Launcher._launchers\n' % call)
+
+
+def test_concurrent_first_use_discovers_once() -> None:
+    _run_fresh('import threading\n'
+               'import time\n'
+               'import psij\n'
+               'scanned = []\n'
+               'find_plugins = psij._find_plugins\n'
+               'def _find_plugins(root, path):\n'
+               '    scanned.append(path)\n'
+               '    time.sleep(0.01)\n'
+               '    find_plugins(root, path)\n'
+               'psij._find_plugins = _find_plugins\n'
+               'names = []\n'
+               'threads = [threading.Thread(target=lambda: '
+               'names.append(psij.JobExecutor.get_executor_names())) for _ in range(8)]\n'
+               'for t in threads:\n'
+               '    t.start()\n'
+               'for t in threads:\n'
+               '    t.join()\n'
+               'assert scanned and len(scanned) == len(set(scanned)), scanned\n'
+               '# no caller sees a partially populated registry\n'
+               'assert len(names) == 8 and all(\'local\' in n for n in names), names\n')
+
+
+def _make_plugin(root: Path, name: str, body: str) -> Dict[str, List[_VersionEntry[object]]]:
+    # a plugin module that counts how many times it was executed in <root>/<name>.count
+    (root / (name + '.py')).write_text('with open(%r, \'a\') as f:\n'
+                                       '    f.write(\'x\')\n'
+                                       '%s\n' % (str(root / (name + '.count')), body))
+    store: Dict[str, List[_VersionEntry[object]]] = {}
+    _register_plugin(Descriptor(name=name, version=Version('0.0.1'), cls=name + '.Plugin'),
+                     str(root), 'executor', store)
+    return store
+
+
+def _load_count(root: Path, name: str) -> int:
+    count_file = root / (name + '.count')
+    return len(count_file.read_text()) if count_file.exists() else 0
+
+
+def test_lazy_loading(tmp_path: Path) -> None:
+    store = _make_plugin(tmp_path, '_lazy', 'class Plugin:\n    pass')
+    entry = store['_lazy'][0]
+    # registering a plugin does not load it
+    assert entry.ecls is None
+    assert _load_count(tmp_path, '_lazy') == 0
+
+    assert _get_plugin_class('_lazy', None, 'executor', store).ecls is not None
+    assert _get_plugin_class('_lazy', None, 'executor', store) is entry
+    assert _load_count(tmp_path, '_lazy') == 1
+
+
+def test_lazy_loading_failure(tmp_path: Path) -> None:
+    store = _make_plugin(tmp_path, '_lazy_fail', 'raise Exception(\'broken plugin\')')
+    causes = []
+    for _ in range(2):
+        try:
+            _get_plugin_class('_lazy_fail', None, 'executor', store)
+            assert False
+        except ValueError as ve:
+            assert 'Unable to load executor' in str(ve)
+            causes.append(ve.__cause__)
+    # the failure is remembered rather than the module being executed again
+    assert causes[0] is causes[1]
+    assert 'broken plugin' in str(causes[0])
+
+    # another plugin in the same module reports the failure without executing it again
+    _register_plugin(Descriptor(name='_lazy_fail2', version=Version('0.0.1'),
+                                cls='_lazy_fail.Plugin2'), str(tmp_path), 'executor', store)
+    try:
+        _get_plugin_class('_lazy_fail2', None, 'executor', store)
+        assert False
+    except ValueError as ve:
+        assert ve.__cause__ is not causes[0]
+        assert 'broken plugin' in str(ve.__cause__)
+    assert _load_count(tmp_path, '_lazy_fail') == 1
+
+
+def test_lazy_loading_concurrent(tmp_path: Path) -> None:
+    store = _make_plugin(tmp_path, '_lazy_slow', 'import time\n'
+                                                 'time.sleep(1)\n'
+                                                 'class Plugin:\n    pass')
+    JobExecutor.get_instance('_always_loads')
+    barrier = threading.Barrier(8)
+    classes: List[Optional[type]] = []
+
+    def load() -> None:
+        barrier.wait()
+        classes.append(_get_plugin_class('_lazy_slow', None, 'executor', store).ecls)
+
+    threads = [threading.Thread(target=load) for _ in range(8)]
+    for t in threads:
+        t.start()
+    # wait for the slow plugin to start loading
+    deadline = time.monotonic() + 10
+    while _load_count(tmp_path, '_lazy_slow') == 0:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    # loading a slow plugin does not block lookups of other, already loaded plugins
+    start = time.monotonic()
+    JobExecutor.get_instance('_always_loads')
+    assert time.monotonic() - start < 0.5
+    for t in threads:
+        t.join()
+
+    assert len(classes) == 8
+    assert classes[0] is not None
+    assert all(cls is classes[0] for cls in classes)
+    assert _load_count(tmp_path, '_lazy_slow') == 1
+
+
+def test_lazy_loading_reentrant(tmp_path: Path) -> None:
+    # a plugin that looks up another plugin while it is being loaded
+    store = _make_plugin(tmp_path, '_lazy_reentrant', 'from psij import JobExecutor\n'
+                                                      'JobExecutor.get_instance(\'p1-tp1\')\n'
+                                                      'class Plugin:\n    pass')
+    assert _get_plugin_class('_lazy_reentrant', None, 'executor', store).ecls is not None